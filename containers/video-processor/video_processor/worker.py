@@ -2,7 +2,10 @@ import os
 import json
 import boto3
 import time
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 import botocore.exceptions
 from botocore.config import Config
@@ -23,14 +26,22 @@ except ImportError:
 
 # Configure logging
 log_level = os.environ.get("WORKER_LOG_LEVEL", "INFO").upper()
+# Records are formatted and queued on the calling thread; a background
+# listener does the console and file writes
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.StreamHandler(),  # Console output
+    logging.FileHandler('/app/logs/worker.log'),  # File output
+    respect_handler_level=True
+)
 logging.basicConfig(
     level=getattr(logging, log_level),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),  # Console output
-        logging.FileHandler('/app/logs/worker.log')  # File output
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # === Environment Variables ===
@@ -2,7 +2,10 @@ import os
 import json
 import boto3
 import time
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 import botocore.exceptions
 from datetime import datetime
@@ -27,14 +30,22 @@ except ImportError:
     print("Warning: valthera_core not available, using direct boto3 client")
 
 # Configure logging
+# Records are formatted and queued on the calling thread; a background
+# listener does the console and file writes
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.StreamHandler(),  # Console output
+    logging.FileHandler('/app/logs/worker.log'),  # File output
+    respect_handler_level=True
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),  # Console output
-        logging.FileHandler('/app/logs/worker.log')  # File output
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # === Environment Variables ===
@@ -83,11 +83,9 @@ async def analyze(request: AnalysisRequestModel):
         result = await smart_pipeline.process_request(analysis_request)
         
         # Convert detections to JSON-serializable format
-        detections_data = {}
-        for classifier_type, detections in result.detections.items():
-            detections_data[classifier_type] = []
-            for detection in detections:
-                detection_data = {
+        detections_data = {
+            classifier_type: [
+                {
                     "bbox": detection.bbox,
                     "confidence": detection.confidence,
                     "class_id": detection.class_id,
@@ -99,10 +97,14 @@ async def analyze(request: AnalysisRequestModel):
                     "processing_time_ms": detection.processing_time_ms,
                     "model_version": detection.model_version
                 }
-                detections_data[classifier_type].append(detection_data)
+                for detection in detections
+            ]
+            for classifier_type, detections in result.detections.items()
+        }
         
-        # Create response
-        response = AnalysisResponseModel(
+        # Create response without validating it here; FastAPI already
+        # validates the returned value against response_model
+        response = AnalysisResponseModel.model_construct(
             frame_id=result.frame_id,
             timestamp=result.timestamp,
             processing_time_ms=result.processing_time_ms,
@@ -113,7 +115,7 @@ async def analyze(request: AnalysisRequestModel):
             detection_count=result.get_total_detections()
         )
         
-        logger.info(f"[API] Analysis completed: {response.detection_count} detections in {response.processing_time_ms:.2f}ms")
+        logger.info("[API] Analysis completed: %d detections in %.2fms", response.detection_count, response.processing_time_ms)
         return response
         
     except Exception as e:
@@ -84,7 +84,7 @@ class FaceClassifier(BaseClassifier):
         if not NUMPY_AVAILABLE or frame is None:
             return []
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Run YOLO inference
@@ -124,7 +124,7 @@ class FaceClassifier(BaseClassifier):
                             detections.append(detection)
             
             # Update performance tracking
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e6
             self.stats.update_stats(len(detections), processing_time)
             
             # Update processing time in detections
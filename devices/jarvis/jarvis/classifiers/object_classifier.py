@@ -91,7 +91,7 @@ class ObjectClassifier(BaseClassifier):
         if not NUMPY_AVAILABLE or frame is None:
             return []
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Run YOLO inference
@@ -127,7 +127,7 @@ class ObjectClassifier(BaseClassifier):
                             detections.append(detection)
             
             # Update performance tracking
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e6
             self.stats.update_stats(len(detections), processing_time)
             
             # Update processing time in detections
@@ -104,12 +104,12 @@ class ResultCache:
                     entry.last_access = current_time
                     self.hits += 1
                     
-                    logger.debug(f"[CACHE] Hit for key: {cache_key[:20]}...")
+                    logger.debug("[CACHE] Hit for key: %.20s...", cache_key)
                     return entry.result
                 else:
                     # Entry expired, remove it
                     del self.cache[cache_key]
-                    logger.debug(f"[CACHE] Expired entry removed: {cache_key[:20]}...")
+                    logger.debug("[CACHE] Expired entry removed: %.20s...", cache_key)
             
             self.misses += 1
             return None
@@ -133,7 +133,7 @@ class ResultCache:
             )
             
             self.cache[cache_key] = entry
-            logger.debug(f"[CACHE] Cached result for key: {cache_key[:20]}...")
+            logger.debug("[CACHE] Cached result for key: %.20s...", cache_key)
     
     def _evict_oldest(self):
         """Evict the oldest cache entry"""
@@ -145,7 +145,7 @@ class ResultCache:
         del self.cache[oldest_key]
         self.evictions += 1
         
-        logger.debug(f"[CACHE] Evicted oldest entry: {oldest_key[:20]}...")
+        logger.debug("[CACHE] Evicted oldest entry: %.20s...", oldest_key)
     
     def cleanup_expired(self):
         """Remove expired entries from cache"""
@@ -161,7 +161,7 @@ class ResultCache:
                 del self.cache[key]
         
         if expired_keys:
-            logger.debug(f"[CACHE] Cleaned up {len(expired_keys)} expired entries")
+            logger.debug("[CACHE] Cleaned up %d expired entries", len(expired_keys))
     
     def clear(self):
         """Clear all cache entries"""
@@ -20,6 +20,13 @@ try:
 except ImportError:
     NUMPY_AVAILABLE = False
 
+# uvloop comes with uvicorn[standard]; fall back to the stdlib loop without it
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from ..models.base import (
     UnifiedDetection, AnalysisRequest, AnalysisResult, 
     PipelineConfig, FrameMetadata, create_analysis_result_from_legacy
@@ -53,7 +60,7 @@ class ProcessingPipeline:
     
     async def execute(self, frame: np.ndarray, request: AnalysisRequest) -> AnalysisResult:
         """Execute processing pipeline efficiently"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # 1. Check cache first
         cached_result = self.cache.get_cached_result(frame, request)
@@ -81,7 +88,7 @@ class ProcessingPipeline:
         self.cache.cache_result(frame, request, final_result)
         
         # Update statistics
-        processing_time = (time.time() - start_time) * 1000
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e6
         with self._lock:
             self.stats.last_processing_time_ms = processing_time
             if self.stats.average_processing_time_ms == 0:
@@ -407,34 +414,35 @@ class SmartCVPipeline:
         """Main CV pipeline processing loop"""
         logger.info("[SMART_PIPELINE] Starting smart CV pipeline loop...")
         
-        while self.is_running:
-            try:
-                current_time = time.time()
-                
-                # Process at specified interval
-                if current_time - self.last_process_time >= self.process_interval:
-                    # Get latest depth frame
-                    depth_frame = self.depth_camera.get_latest_frame()
+        # One event loop for the lifetime of this thread, so the loop and its
+        # default executor aren't rebuilt for every frame
+        loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        
+        try:
+            while self.is_running:
+                try:
+                    current_time = time.time()
                     
-                    if depth_frame:
-                        # Create default analysis request
-                        request = AnalysisRequest(
-                            classifiers=self.config.enabled_classifiers,
-                            options={
-                                "confidence_threshold": self.config.confidence_threshold,
-                                "include_depth": self.config.include_depth,
-                                "include_3d_position": self.config.include_3d_position,
-                                "max_detections": self.config.max_detections
-                            },
-                            frame_id=depth_frame.frame_id
-                        )
+                    # Process at specified interval
+                    if current_time - self.last_process_time >= self.process_interval:
+                        # Get latest depth frame
+                        depth_frame = self.depth_camera.get_latest_frame()
                         
-                        # Process request (run in async context)
-                        try:
-                            # Create a new event loop for this thread
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
+                        if depth_frame:
+                            # Create default analysis request
+                            request = AnalysisRequest(
+                                classifiers=self.config.enabled_classifiers,
+                                options={
+                                    "confidence_threshold": self.config.confidence_threshold,
+                                    "include_depth": self.config.include_depth,
+                                    "include_3d_position": self.config.include_3d_position,
+                                    "max_detections": self.config.max_detections
+                                },
+                                frame_id=depth_frame.frame_id
+                            )
                             
+                            # Process request (run in async context)
                             try:
                                 result = loop.run_until_complete(self.process_request(request))
                                 
@@ -448,24 +456,24 @@ class SmartCVPipeline:
                                 
                                 # Log detections
                                 if result.has_detections():
-                                    logger.info(f"[SMART_PIPELINE] Detected {result.get_total_detections()} objects in frame {result.frame_id}")
+                                    logger.info("[SMART_PIPELINE] Detected %d objects in frame %s", result.get_total_detections(), result.frame_id)
                             
-                            finally:
-                                loop.close()
-                                # Clear the event loop to avoid conflicts
-                                asyncio.set_event_loop(None)
+                            except Exception as e:
+                                logger.error(f"[SMART_PIPELINE] Error processing request: {e}")
                         
-                        except Exception as e:
-                            logger.error(f"[SMART_PIPELINE] Error processing request: {e}")
+                        self.last_process_time = current_time
+                    else:
+                        # Sleep to avoid busy waiting
+                        time.sleep(0.01)
                     
-                    self.last_process_time = current_time
-                else:
-                    # Sleep to avoid busy waiting
-                    time.sleep(0.01)
-                
-            except Exception as e:
-                logger.error(f"[SMART_PIPELINE] Error in pipeline loop: {e}")
-                time.sleep(0.1)
+                except Exception as e:
+                    logger.error(f"[SMART_PIPELINE] Error in pipeline loop: {e}")
+                    time.sleep(0.1)
+        finally:
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+            # Clear the event loop to avoid conflicts
+            asyncio.set_event_loop(None)
     
     def get_latest_result(self) -> Optional[AnalysisResult]:
         """Get the latest analysis result"""
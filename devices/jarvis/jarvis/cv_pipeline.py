@@ -233,7 +233,7 @@ class CVPipeline:
                             
                             # Log detections
                             if result.detections:
-                                logger.info(f"[CV_PIPELINE] Detected {len(result.detections)} person(s) in frame {result.frame_id}")
+                                logger.info("[CV_PIPELINE] Detected %d person(s) in frame %s", len(result.detections), result.frame_id)
                     
                     self.last_process_time = current_time
                 else:
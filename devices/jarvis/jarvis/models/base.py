@@ -29,7 +29,7 @@ class ClassifierType(Enum):
     EMOTION = "emotion"
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedDetection:
     """Unified detection format for all classifiers"""
     # Core detection data
@@ -84,7 +84,7 @@ class AnalysisRequest:
                 raise ValueError(f"Invalid classifier: {classifier}. Valid options: {valid_classifiers}")
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Comprehensive analysis result"""
     frame_id: int
@@ -157,7 +157,7 @@ class PipelineConfig:
             raise ValueError("width and height must be positive")
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameMetadata:
     """Metadata about a processed frame"""
     frame_id: int
@@ -173,7 +173,7 @@ class VideoProcessor:
             # Log if count changed or periodically
             current_time = time.time()
             if person_count != self.last_person_count or (current_time - self.last_process_time) > 5.0:
-                logger.info(f"[VIDEO] Detected {person_count} person(s) in frame")
+                logger.info("[VIDEO] Detected %d person(s) in frame", person_count)
                 self.last_person_count = person_count
                 self.last_process_time = current_time
             
@@ -1,5 +1,7 @@
 import boto3
 import json
+import orjson
+import functools
 import os
 import uuid
 from datetime import datetime
@@ -7,14 +9,25 @@ from decimal import Decimal
 import base64
 from valthera_core import get_user_id_from_event
 
+# DynamoDB table name, resolved once per container
+table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
+
+
 class DecimalEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, Decimal):
             return str(obj)
         return super(DecimalEncoder, self).default(obj)
 
+def _json_default(obj):
+    """Convert DynamoDB Decimals for orjson, matching DecimalEncoder."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError
+
+@functools.lru_cache(maxsize=1)
 def get_dynamodb_resource():
-    """Get DynamoDB resource with proper endpoint configuration."""
+    """Get DynamoDB resource with proper endpoint configuration (cached per container)."""
     aws_endpoint_url = os.environ.get('AWS_ENDPOINT_URL')
     if aws_endpoint_url:
         # For Docker containers, use host.docker.internal to connect to host
@@ -32,7 +45,6 @@ def get_dynamodb_resource():
         return boto3.resource('dynamodb')
 
 
-
 def require_authentication(user_id):
     """Check if authentication is required."""
     return user_id is None
@@ -45,22 +57,25 @@ def get_auth_error_response():
         'body': json.dumps({'error': 'User not authenticated'})
     }
 
+# CORS headers, built once per container and shared by every response
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,X-Amz-User-Agent,X-Requested-With',
+    'Access-Control-Allow-Methods': 'DELETE,GET,OPTIONS,POST,PUT',
+    'Access-Control-Allow-Credentials': 'true',
+    'Access-Control-Expose-Headers': 'Access-Control-Allow-Origin,Access-Control-Allow-Credentials'
+}
+
 def get_cors_headers():
     """Get CORS headers."""
-    return {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,X-Amz-User-Agent,X-Requested-With',
-        'Access-Control-Allow-Methods': 'DELETE,GET,OPTIONS,POST,PUT',
-        'Access-Control-Allow-Credentials': 'true',
-        'Access-Control-Expose-Headers': 'Access-Control-Allow-Origin,Access-Control-Allow-Credentials'
-    }
+    return CORS_HEADERS
 
 def success_response(data, status_code=200):
     """Create a successful response."""
     return {
         'statusCode': status_code,
         'headers': get_cors_headers(),
-        'body': json.dumps(data, cls=DecimalEncoder)
+        'body': orjson.dumps(data, default=_json_default).decode()
     }
 
 def error_response(message, status_code=400, code=None):
@@ -72,7 +87,7 @@ def error_response(message, status_code=400, code=None):
     return {
         'statusCode': status_code,
         'headers': get_cors_headers(),
-        'body': json.dumps(response_data, cls=DecimalEncoder)
+        'body': orjson.dumps(response_data, default=_json_default).decode()
     }
 
 def lambda_handler(event, context):
@@ -122,7 +137,6 @@ def lambda_handler(event, context):
         
         # Get DynamoDB resource
         dynamodb = get_dynamodb_resource()
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
         table = dynamodb.Table(table_name)
         
         # Create concept item
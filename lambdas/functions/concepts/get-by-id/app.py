@@ -11,6 +11,9 @@ from valthera_core import (
     not_found_response
 )
 
+# DynamoDB table name, resolved once per container
+table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
+
 
 class DecimalEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -63,7 +66,6 @@ def lambda_handler(event, context):
             print("No AWS_ENDPOINT_URL found, using default AWS DynamoDB")
         
         # Use the main table
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
         table = dynamodb.Table(table_name)
         print(f"Using table: {table_name}")
         
@@ -1,25 +1,33 @@
 #!/usr/bin/env python3
 
 import json
+import orjson
 import os
 import boto3
 from decimal import Decimal
 from datetime import datetime
 from valthera_core import get_user_id_from_event
 
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return int(obj)
-        return super(DecimalEncoder, self).default(obj)
+# DynamoDB table name, resolved once per container
+table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
+
+
+def _json_default(obj):
+    """Convert DynamoDB Decimals to int for orjson."""
+    if isinstance(obj, Decimal):
+        return int(obj)
+    raise TypeError
+
+# CORS headers, built once per container and shared by every response
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,Authorization',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
+}
 
 def get_cors_headers():
     """Get CORS headers for local development."""
-    return {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Headers': 'Content-Type,Authorization',
-        'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
-    }
+    return CORS_HEADERS
 
 def success_response(data, status_code=200):
     """Return a successful response."""
@@ -29,7 +37,7 @@ def success_response(data, status_code=200):
             'Content-Type': 'application/json',
             **get_cors_headers()
         },
-        'body': json.dumps(data, cls=DecimalEncoder)
+        'body': orjson.dumps(data, default=_json_default).decode()
     }
 
 def error_response(message, status_code=500, error_code='ERROR'):
@@ -105,7 +113,6 @@ def verify_project_ownership(user_id, project_id):
             print("No AWS_ENDPOINT_URL found - using default AWS DynamoDB")
 
         # Use the main table
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
         table = dynamodb.Table(table_name)
         print(f"Using table: {table_name}")
 
@@ -183,7 +190,6 @@ def lambda_handler(event, context):
             print("No AWS_ENDPOINT_URL found - using default AWS DynamoDB")
 
         # Use the main table
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
         table = dynamodb.Table(table_name)
         print(f"Using table: {table_name}")
         
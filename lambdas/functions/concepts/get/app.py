@@ -1,5 +1,6 @@
 import boto3
 import json
+import functools
 import os
 from datetime import datetime
 from decimal import Decimal
@@ -12,14 +13,19 @@ from valthera_core import (
     not_found_response
 )
 
+# DynamoDB table name, resolved once per container
+table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
+
+
 class DecimalEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, Decimal):
             return str(obj)
         return super(DecimalEncoder, self).default(obj)
 
+@functools.lru_cache(maxsize=1)
 def get_dynamodb_resource():
-    """Get DynamoDB resource with proper endpoint configuration."""
+    """Get DynamoDB resource with proper endpoint configuration (cached per container)."""
     aws_endpoint_url = os.environ.get('AWS_ENDPOINT_URL')
     if aws_endpoint_url:
         # For Docker containers, use host.docker.internal to connect to host
@@ -37,7 +43,6 @@ def get_dynamodb_resource():
         return boto3.resource('dynamodb')
 
 
-
 def lambda_handler(event, context):
     """List all concepts for a project."""
     try:
@@ -70,7 +75,6 @@ def lambda_handler(event, context):
         
         # Get DynamoDB resource
         dynamodb = get_dynamodb_resource()
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
         table = dynamodb.Table(table_name)
         print(f"Using table: {table_name}")
         
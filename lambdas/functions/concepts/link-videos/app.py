@@ -1,34 +1,48 @@
 import json
+import orjson
 import boto3
 import os
 from datetime import datetime
 from decimal import Decimal
 from valthera_core import get_user_id_from_event
 
+# DynamoDB table name, resolved once per container
+table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
+
+
 class DecimalEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, Decimal):
             return str(obj)
         return super(DecimalEncoder, self).default(obj)
 
+def _json_default(obj):
+    """Convert DynamoDB Decimals for orjson, matching DecimalEncoder."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError
+
+
+# CORS headers, built once per container and shared by every response
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,X-Amz-User-Agent,X-Requested-With',
+    'Access-Control-Allow-Methods': 'DELETE,GET,OPTIONS,POST,PUT',
+    'Access-Control-Allow-Credentials': 'true',
+    'Access-Control-Expose-Headers': 'Access-Control-Allow-Origin,Access-Control-Allow-Credentials'
+}
 
 
 def get_cors_headers():
     """Get CORS headers."""
-    return {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,X-Amz-User-Agent,X-Requested-With',
-        'Access-Control-Allow-Methods': 'DELETE,GET,OPTIONS,POST,PUT',
-        'Access-Control-Allow-Credentials': 'true',
-        'Access-Control-Expose-Headers': 'Access-Control-Allow-Origin,Access-Control-Allow-Credentials'
-    }
+    return CORS_HEADERS
 
 def success_response(data, status_code=200):
     """Create a successful response."""
     return {
         'statusCode': status_code,
         'headers': get_cors_headers(),
-        'body': json.dumps(data, cls=DecimalEncoder)
+        'body': orjson.dumps(data, default=_json_default).decode()
     }
 
 def error_response(message, status_code=400, code=None):
@@ -40,7 +54,7 @@ def error_response(message, status_code=400, code=None):
     return {
         'statusCode': status_code,
         'headers': get_cors_headers(),
-        'body': json.dumps(response_data, cls=DecimalEncoder)
+        'body': orjson.dumps(response_data, default=_json_default).decode()
     }
 
 def lambda_handler(event, context):
@@ -119,7 +133,6 @@ def lambda_handler(event, context):
             print("No AWS_ENDPOINT_URL found - using default AWS DynamoDB")
         
         # Use the main table
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
         table = dynamodb.Table(table_name)
         print(f"Using table: {table_name}")
         
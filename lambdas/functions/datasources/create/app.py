@@ -16,6 +16,10 @@ from valthera_core import (
     Config
 )
 
+# DynamoDB table name, resolved once per container
+table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
+
+
 class DecimalEncoder(json.JSONEncoder):
     """Custom JSON encoder to handle Decimal types from DynamoDB."""
     def default(self, obj):
@@ -45,11 +49,8 @@ def decode_jwt_payload(token):
 
 def validate_required_fields(data, required_fields):
     """Validate that all required fields are present."""
-    missing_fields = []
-    for field in required_fields:
-        if field not in data or not data[field]:
-            missing_fields.append(field)
-    return missing_fields
+    # data.get covers both the absent and the empty case in a single lookup
+    return [field for field in required_fields if not data.get(field)]
 
 ## Use shared response helpers from valthera_core
 
@@ -124,7 +125,6 @@ def lambda_handler(event, context):
         print(f"ENVIRONMENT: {os.environ.get('ENVIRONMENT')}")
         print(f"AWS_ENDPOINT_URL: {os.environ.get('AWS_ENDPOINT_URL')}")
         dynamodb = get_dynamodb_resource()
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
         print(f"Table name: {table_name}")
         table = dynamodb.Table(table_name)
         
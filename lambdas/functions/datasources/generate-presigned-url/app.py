@@ -1,4 +1,5 @@
 import json
+import logging
 import boto3
 import uuid
 from datetime import datetime
@@ -14,6 +15,13 @@ from valthera_core import (
     not_found_response,
     Config
 )
+
+# DynamoDB table name, resolved once per container
+table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
+
+# Request/response dumps are only formatted when DEBUG logging is enabled
+logger = logging.getLogger(__name__)
+
 # Remove valthera_core imports and implement functions directly
 def log_execution_time(func):
     """Decorator to log function execution time."""
@@ -23,33 +31,39 @@ def log_execution_time(func):
 
 def log_request_info(event):
     """Log request information."""
-    print(f"Request method: {event.get('httpMethod')}")
-    print(f"Request path: {event.get('path')}")
-    print(f"Request headers: {event.get('headers')}")
-    print(f"Request body: {event.get('body')}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Request %s %s", event.get('httpMethod'), event.get('path'))
+        logger.debug("Request headers: %s", event.get('headers'))
+        logger.debug("Request body: %s", event.get('body'))
 
 def log_error(error, context=None):
     """Log error information."""
-    print(f"ERROR: {error}")
     if context:
-        print(f"Context: {context}")
+        logger.error("ERROR: %s (context: %s)", error, context)
+    else:
+        logger.error("ERROR: %s", error)
 
 def log_response_info(response):
     """Log response information."""
-    print(f"Response: {response}")
+    logger.debug("Response: %s", response)
 
 ## Use shared response helpers
 
+# Video extensions accepted for upload; the set is used for lookups
+ALLOWED_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm')
+ALLOWED_EXTENSION_SET = frozenset(ALLOWED_EXTENSIONS)
+
 def validate_file_type(filename):
     """Validate file type based on extension."""
-    allowed_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm']
-    file_extension = os.path.splitext(filename.lower())[1]
+    # splitext only looks at the basename and treats leading dots (".mp4")
+    # as part of the name; only the extension itself is lowercased
+    file_extension = os.path.splitext(filename)[1].lower()
     
     if not file_extension:
         return False, 'File must have a valid extension'
     
-    if file_extension not in allowed_extensions:
-        return False, f'File type {file_extension} is not supported. Allowed types: {", ".join(allowed_extensions)}'
+    if file_extension not in ALLOWED_EXTENSION_SET:
+        return False, f'File type {file_extension} is not supported. Allowed types: {", ".join(ALLOWED_EXTENSIONS)}'
     
     return True, None
 
@@ -118,7 +132,6 @@ def lambda_handler(event, context):
         # Verify data source exists and belongs to user
         dynamodb = get_dynamodb_resource()
         
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
         print(f"Table name: {table_name}")
         table = dynamodb.Table(table_name)
         
@@ -1,4 +1,6 @@
 import json
+import orjson
+import functools
 import boto3
 import base64
 import sys
@@ -6,15 +8,19 @@ import os
 from decimal import Decimal
 from valthera_core import get_user_id_from_event
 
-class DecimalEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle Decimal types from DynamoDB."""
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super(DecimalEncoder, self).default(obj)
+# DynamoDB table name, resolved once per container
+table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
 
+
+def _json_default(obj):
+    """Convert DynamoDB Decimals to float for orjson."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError
+
+@functools.lru_cache(maxsize=1)
 def get_dynamodb_resource():
-    """Get DynamoDB resource with proper endpoint configuration."""
+    """Get DynamoDB resource with proper endpoint configuration (cached per container)."""
     aws_endpoint_url = os.environ.get('AWS_ENDPOINT_URL')
     if aws_endpoint_url:
         # For Docker containers, use host.docker.internal to connect to host
@@ -44,21 +50,24 @@ def decode_jwt_payload(token):
         print(f"Error decoding JWT: {e}")
         return None
 
+# CORS headers, built once per container and shared by every response
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,Origin,X-Requested-With',
+    'Access-Control-Allow-Methods': 'OPTIONS,GET,POST,PUT,DELETE,PATCH',
+    'Access-Control-Allow-Credentials': 'true'
+}
+
 def get_cors_headers():
     """Get CORS headers for the response."""
-    return {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,Origin,X-Requested-With',
-        'Access-Control-Allow-Methods': 'OPTIONS,GET,POST,PUT,DELETE,PATCH',
-        'Access-Control-Allow-Credentials': 'true'
-    }
+    return CORS_HEADERS
 
 def success_response(data, status_code=200):
     """Create a successful response."""
     return {
         'statusCode': status_code,
         'headers': get_cors_headers(),
-        'body': json.dumps(data, cls=DecimalEncoder)
+        'body': orjson.dumps(data, default=_json_default).decode()
     }
 
 def error_response(message, status_code=400):
@@ -105,7 +114,6 @@ def lambda_handler(event, context):
         
         # Get DynamoDB resource
         dynamodb = get_dynamodb_resource()
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
         print(f"Table name: {table_name}")
         table = dynamodb.Table(table_name)
         
@@ -1,5 +1,6 @@
 import json
 import boto3
+import logging
 import os
 from decimal import Decimal
 
@@ -11,6 +12,10 @@ from valthera_core import (
     get_dynamodb_resource
 )
 
+# DynamoDB table name, resolved once per container
+table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
+
+
 class DecimalEncoder(json.JSONEncoder):
     """Custom JSON encoder to handle Decimal types from DynamoDB."""
     def default(self, obj):
@@ -18,6 +23,9 @@ class DecimalEncoder(json.JSONEncoder):
             return float(obj)
         return super(DecimalEncoder, self).default(obj)
 
+# Per-request debug output is only formatted when DEBUG logging is enabled
+logger = logging.getLogger(__name__)
+
 ## Using shared get_dynamodb_resource from valthera_core which handles
 ## local Docker vs host endpoint resolution consistently across functions
 
@@ -40,7 +48,8 @@ def transform_datasource_item(item):
 def lambda_handler(event, context):
     """List all data sources for the authenticated user."""
     try:
-        print(f"Event: {json.dumps(event)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Event: %s", json.dumps(event))
         
         # Handle OPTIONS request for CORS preflight
         if event.get('httpMethod') == 'OPTIONS':
@@ -52,12 +61,13 @@ def lambda_handler(event, context):
         
         # Get user ID from event
         user_id = get_user_id_from_event(event)
-        print(f"User ID: {user_id}")
         
-        # Debug environment variables
-        print(f"ENVIRONMENT: {os.environ.get('ENVIRONMENT')}")
-        print(f"AWS_ENDPOINT_URL: {os.environ.get('AWS_ENDPOINT_URL')}")
-        print(f"LOCAL_DEFAULT_USER_ID: {os.environ.get('LOCAL_DEFAULT_USER_ID')}")
+        # Debug user and environment variables
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("User ID: %s", user_id)
+            logger.debug("ENVIRONMENT: %s", os.environ.get('ENVIRONMENT'))
+            logger.debug("AWS_ENDPOINT_URL: %s", os.environ.get('AWS_ENDPOINT_URL'))
+            logger.debug("LOCAL_DEFAULT_USER_ID: %s", os.environ.get('LOCAL_DEFAULT_USER_ID'))
         
         if not user_id:
             print("No user ID found in request")
@@ -67,8 +77,7 @@ def lambda_handler(event, context):
         
         # Get DynamoDB resource
         dynamodb = get_dynamodb_resource()
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
-        print(f"Table name: {table_name}")
+        logger.debug("Table name: %s", table_name)
         table = dynamodb.Table(table_name)
         
         # Query using PK to get all datasources for the user
@@ -33,6 +33,9 @@ MAX_LAMBDA_VIDEO_SIZE = 50 * 1024 * 1024  # 50MB - Lambda temp storage limit
 # Disable video optimization for local development
 VIDEO_OPTIMIZATION_ENABLED = False  # Disabled for local development
 
+# DynamoDB table name, resolved once per container
+table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
+
 
 def should_optimize_video(file_size, file_type):
     """Determine if video should be optimized in Lambda."""
@@ -227,7 +230,6 @@ def lambda_handler(event, context):
         # Get data source from DynamoDB
         dynamodb = get_dynamodb_resource()
         
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
         print(f"Table name: {table_name}")
         table = dynamodb.Table(table_name)
         
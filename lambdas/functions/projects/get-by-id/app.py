@@ -1,12 +1,14 @@
 import json
+import functools
 import os
 import boto3
 from botocore.exceptions import ClientError
 import base64
 from valthera_core import get_user_id_from_event
 
+@functools.lru_cache(maxsize=1)
 def get_dynamodb_resource():
-    """Get DynamoDB resource with proper endpoint configuration."""
+    """Get DynamoDB resource with proper endpoint configuration (cached per container)."""
     aws_endpoint_url = os.environ.get('AWS_ENDPOINT_URL')
     if aws_endpoint_url:
         # For Docker containers, use host.docker.internal to connect to host
@@ -25,15 +27,19 @@ def get_dynamodb_resource():
 
 
 
+# CORS headers, built once per container and shared by every response
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,X-Amz-User-Agent,X-Requested-With',
+    'Access-Control-Allow-Methods': 'DELETE,GET,OPTIONS,POST,PUT',
+    'Access-Control-Allow-Credentials': 'true',
+    'Access-Control-Expose-Headers': 'Access-Control-Allow-Origin,Access-Control-Allow-Credentials'
+}
+
+
 def get_cors_headers():
     """Get CORS headers."""
-    return {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,X-Amz-User-Agent,X-Requested-With',
-        'Access-Control-Allow-Methods': 'DELETE,GET,OPTIONS,POST,PUT',
-        'Access-Control-Allow-Credentials': 'true',
-        'Access-Control-Expose-Headers': 'Access-Control-Allow-Origin,Access-Control-Allow-Credentials'
-    }
+    return CORS_HEADERS
 
 def success_response(data, status_code=200):
     """Create a successful response."""
@@ -11,6 +11,10 @@ from valthera_core import (
     DecimalEncoder
 )
 
+# DynamoDB table name, resolved once per container
+table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
+
+
 def lambda_handler(event, context):
     """Get all projects for a user."""
     try:
@@ -33,7 +37,6 @@ def lambda_handler(event, context):
         
         # Get DynamoDB resource
         dynamodb = get_dynamodb_resource()
-        table_name = os.environ.get('MAIN_TABLE_NAME', 'valthera-dev-main')
         table = dynamodb.Table(table_name)
         
         # Query projects for the user
@@ -42,38 +42,42 @@ def lambda_handler(event, context):
             return error_response('Project not found', 404)
         
         # Update fields
-        update_expression = "SET updated_at = :updated_at"
+        update_parts = ['updated_at = :updated_at']
         expression_attribute_values = {
             ':updated_at': datetime.utcnow().isoformat()
         }
+        expression_attribute_names = {}
         
         if name is not None:
-            update_expression += ", #n = :name"
+            update_parts.append('#n = :name')
             expression_attribute_values[':name'] = name
-            expression_attribute_names = {'#n': 'name'}
+            expression_attribute_names['#n'] = 'name'
         
         if description is not None:
-            update_expression += ", description = :description"
+            update_parts.append('description = :description')
             expression_attribute_values[':description'] = description
         
         if has_droid_dataset is not None:
-            update_expression += ", has_droid_dataset = :has_droid_dataset"
+            update_parts.append('has_droid_dataset = :has_droid_dataset')
             expression_attribute_values[':has_droid_dataset'] = has_droid_dataset
         
         if linked_data_sources is not None:
-            update_expression += ", linked_data_sources = :linked_data_sources"
+            update_parts.append('linked_data_sources = :linked_data_sources')
             expression_attribute_values[':linked_data_sources'] = linked_data_sources
         
-        # Update project
-        table.update_item(
-            Key={
+        update_kwargs = {
+            'Key': {
                 'PK': f'USER#{user_id}',
                 'SK': f'PROJECT#{project_id}'
             },
-            UpdateExpression=update_expression,
-            ExpressionAttributeValues=expression_attribute_values,
-            ExpressionAttributeNames=expression_attribute_names if 'name' in locals() else None
-        )
+            'UpdateExpression': 'SET ' + ', '.join(update_parts),
+            'ExpressionAttributeValues': expression_attribute_values
+        }
+        if expression_attribute_names:
+            update_kwargs['ExpressionAttributeNames'] = expression_attribute_names
+        
+        # Update project
+        table.update_item(**update_kwargs)
         
         # Return success response
         return {
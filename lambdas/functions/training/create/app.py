@@ -1,5 +1,7 @@
 import json
 import boto3
+from cachetools import TTLCache
+import fastjsonschema
 import uuid
 from datetime import datetime
 import sys
@@ -17,6 +19,26 @@ from valthera_core import validate_required_fields
 from valthera_core import success_response, error_response, validation_error_response, not_found_response
 from valthera_core import Config, get_user_id_from_event
 
+# Ownership rarely changes, so warm containers reuse recent checks for a minute
+_OWNERSHIP_CACHE = TTLCache(maxsize=1024, ttl=60)
+
+# Initialize AWS clients once per container
+dynamodb = boto3.resource('dynamodb')
+table = dynamodb.Table(Config.MAIN_TABLE)
+sqs = boto3.client('sqs')
+
+
+# Compiled once per container; validating a config is then a single call
+_VALIDATE_TRAINING_CONFIG = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['modelType', 'hyperparameters', 'dataSources'],
+    'properties': {
+        'modelType': {'enum': ['vjepa2', 'custom', 'baseline']},
+        'hyperparameters': {'type': 'object'},
+        'dataSources': {'type': 'array'}
+    }
+})
+
 
 @log_execution_time
 def lambda_handler(event, context):
@@ -77,13 +99,9 @@ def lambda_handler(event, context):
         }
         
         # Store in DynamoDB
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table(Config.MAIN_TABLE)
-        
         table.put_item(Item=training_item)
         
         # Send training job to SQS queue
-        sqs = boto3.client('sqs')
         queue_url = Config.TRAINING_QUEUE
         
         if queue_url:
@@ -126,10 +144,12 @@ def lambda_handler(event, context):
 
 def verify_project_ownership(user_id, project_id):
     """Verify that the project exists and belongs to the user."""
+    cache_key = (user_id, project_id)
+    is_owner = _OWNERSHIP_CACHE.get(cache_key)
+    if is_owner is not None:
+        return is_owner
+    
     try:
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table(Config.MAIN_TABLE)
-        
         response = table.get_item(
             Key={
                 'PK': f'USER#{user_id}',
@@ -137,7 +157,9 @@ def verify_project_ownership(user_id, project_id):
             }
         )
         
-        return 'Item' in response
+        is_owner = 'Item' in response
+        _OWNERSHIP_CACHE[cache_key] = is_owner
+        return is_owner
     except Exception as e:
         log_error(e, {'function': 'verify_project_ownership', 'user_id': user_id, 'project_id': project_id})
         return False
@@ -146,26 +168,7 @@ def verify_project_ownership(user_id, project_id):
 def validate_training_config(config):
     """Validate training configuration."""
     try:
-        # Check required config fields
-        required_fields = ['modelType', 'hyperparameters', 'dataSources']
-        for field in required_fields:
-            if field not in config:
-                return False
-        
-        # Validate model type
-        valid_model_types = ['vjepa2', 'custom', 'baseline']
-        if config['modelType'] not in valid_model_types:
-            return False
-        
-        # Validate hyperparameters
-        if not isinstance(config['hyperparameters'], dict):
-            return False
-        
-        # Validate data sources
-        if not isinstance(config['dataSources'], list):
-            return False
-        
+        _VALIDATE_TRAINING_CONFIG(config)
         return True
-    except Exception as e:
-        log_error(e, {'function': 'validate_training_config'})
-        return False 
\ No newline at end of file
+    except fastjsonschema.JsonSchemaException:
+        return False
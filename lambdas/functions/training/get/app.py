@@ -1,4 +1,5 @@
 import boto3
+from cachetools import TTLCache
 import sys
 import os
 
@@ -14,6 +15,13 @@ from valthera_core import (
 from valthera_core import success_response, error_response, not_found_response
 from valthera_core import Config
 
+# Ownership rarely changes, so warm containers reuse recent checks for a minute
+_OWNERSHIP_CACHE = TTLCache(maxsize=1024, ttl=60)
+
+# Initialize AWS clients once per container
+dynamodb = boto3.resource('dynamodb')
+table = dynamodb.Table(Config.MAIN_TABLE)
+
 
 @log_execution_time
 def lambda_handler(event, context):
@@ -35,10 +43,6 @@ def lambda_handler(event, context):
         if not verify_project_ownership(user_id, project_id):
             return not_found_response('Project', project_id)
         
-        # Query DynamoDB for project's training jobs
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table(Config.MAIN_TABLE)
-        
         # Query using PK to get all training jobs for the project
         response = table.query(
             KeyConditionExpression='PK = :pk AND begins_with(SK, :sk_prefix)',
@@ -73,10 +77,12 @@ def lambda_handler(event, context):
 
 def verify_project_ownership(user_id, project_id):
     """Verify that the project exists and belongs to the user."""
+    cache_key = (user_id, project_id)
+    is_owner = _OWNERSHIP_CACHE.get(cache_key)
+    if is_owner is not None:
+        return is_owner
+    
     try:
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table(Config.MAIN_TABLE)
-        
         response = table.get_item(
             Key={
                 'PK': f'USER#{user_id}',
@@ -84,7 +90,9 @@ def verify_project_ownership(user_id, project_id):
             }
         )
         
-        return 'Item' in response
+        is_owner = 'Item' in response
+        _OWNERSHIP_CACHE[cache_key] = is_owner
+        return is_owner
     except Exception as e:
         log_error(e, {'function': 'verify_project_ownership', 'user_id': user_id, 'project_id': project_id})
         return False
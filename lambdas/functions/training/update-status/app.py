@@ -1,6 +1,8 @@
 import json
 import boto3
+from cachetools import TTLCache
 from datetime import datetime
+from decimal import Decimal
 import sys
 import os
 
@@ -16,6 +18,16 @@ from valthera_core import (
 from valthera_core import success_response, error_response, not_found_response
 from valthera_core import Config
 
+# Ownership rarely changes, so warm containers reuse recent checks for a minute
+_OWNERSHIP_CACHE = TTLCache(maxsize=1024, ttl=60)
+
+# Initialize AWS clients once per container
+dynamodb = boto3.resource('dynamodb')
+table = dynamodb.Table(Config.MAIN_TABLE)
+
+# DynamoDB caps a single transaction at 100 operations (training job + behaviors)
+MAX_TRANSACT_ITEMS = 100
+
 
 @log_execution_time
 def lambda_handler(event, context):
@@ -35,7 +47,8 @@ def lambda_handler(event, context):
             return error_response('Request body is required', 400)
         
         try:
-            data = json.loads(event['body'])
+            # DynamoDB rejects floats, so read numbers like accuracy as Decimal
+            data = json.loads(event['body'], parse_float=Decimal)
         except json.JSONDecodeError:
             return error_response('Invalid JSON in request body', 400)
         
@@ -48,10 +61,6 @@ def lambda_handler(event, context):
         if not verify_project_ownership(user_id, project_id):
             return not_found_response('Project', project_id)
         
-        # Get training job from DynamoDB
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table(Config.MAIN_TABLE)
-        
         # Check if training job exists
         response = table.get_item(
             Key={
@@ -78,6 +87,16 @@ def lambda_handler(event, context):
                 update_expression += f', {field} = :{field}'
                 expression_attribute_values[f':{field}'] = data[field]
         
+        # Append new log lines in place instead of rewriting the whole list
+        if 'logs_append' in data:
+            if 'logs' in data:
+                return error_response('Provide either logs or logs_append, not both', 400, 'VALIDATION_ERROR')
+            if not isinstance(data['logs_append'], list):
+                return error_response('logs_append must be a list', 400, 'VALIDATION_ERROR')
+            update_expression += ', logs = list_append(if_not_exists(logs, :emptyLogs), :logsAppend)'
+            expression_attribute_values[':emptyLogs'] = []
+            expression_attribute_values[':logsAppend'] = data['logs_append']
+        
         # Validate status transition
         current_status = training_job.get('status', 'preprocessing')
         new_status = data.get('status', current_status)
@@ -85,31 +104,61 @@ def lambda_handler(event, context):
         if not is_valid_status_transition(current_status, new_status):
             return error_response(f'Invalid status transition from {current_status} to {new_status}', 400, 'VALIDATION_ERROR')
         
-        # Update training job in DynamoDB
-        table.update_item(
-            Key={
-                'PK': f'PROJECT#{project_id}',
-                'SK': f'TRAINING#{training_id}'
-            },
-            UpdateExpression=update_expression,
-            ExpressionAttributeValues=expression_attribute_values,
-            ReturnValues='ALL_NEW'
-        )
+        training_key = {
+            'PK': f'PROJECT#{project_id}',
+            'SK': f'TRAINING#{training_id}'
+        }
         
-        # If training completed, update related behaviors
+        behaviors = []
         if new_status == 'completed':
-            update_behavior_training_results(table, project_id, training_id, data)
+            behaviors = get_project_behaviors(table, project_id)
         
-        # Get updated training job
-        updated_response = table.get_item(
-            Key={
-                'PK': f'PROJECT#{project_id}',
-                'SK': f'TRAINING#{training_id}'
-            }
-        )
+        updated_item = None
+        if new_status == 'completed' and len(behaviors) < MAX_TRANSACT_ITEMS:
+            # Write the training job and its behaviors atomically in one round-trip
+            transact_items = [{
+                'Update': {
+                    'TableName': Config.MAIN_TABLE,
+                    'Key': training_key,
+                    'UpdateExpression': update_expression,
+                    'ExpressionAttributeValues': expression_attribute_values
+                }
+            }]
+            transact_items.extend(
+                {'Update': {'TableName': Config.MAIN_TABLE, **build_behavior_update(behavior, training_id, data)}}
+                for behavior in behaviors
+            )
+            try:
+                dynamodb.meta.client.transact_write_items(TransactItems=transact_items)
+            except Exception as e:
+                # Behavior writes must not block the status update, retry without them
+                log_error(e, {'function': 'update_training_status', 'project_id': project_id, 'training_id': training_id})
+            else:
+                # SET only overwrites the listed attributes, so merge them locally
+                updated_item = dict(training_job)
+                updated_item['updatedAt'] = expression_attribute_values[':updatedAt']
+                for field in allowed_fields:
+                    if field in data:
+                        updated_item[field] = data[field]
+                if 'logs_append' in data:
+                    updated_item['logs'] = list(training_job.get('logs', [])) + data['logs_append']
+        
+        if updated_item is None:
+            # Update training job in DynamoDB
+            updated_response = table.update_item(
+                Key=training_key,
+                UpdateExpression=update_expression,
+                ExpressionAttributeValues=expression_attribute_values,
+                ReturnValues='ALL_NEW'
+            )
+            updated_item = updated_response['Attributes']
+            
+            # Too many behaviors for one transaction (or it failed), update them individually
+            if behaviors:
+                update_behavior_training_results(table, behaviors, project_id, training_id, data)
         
         # Transform and return updated training job
-        training_job = transform_training_job_item(updated_response['Item'])
+        training_job = transform_training_job_item(updated_item)
         
         response_data = success_response(training_job)
         log_response_info(response_data)
@@ -122,10 +171,12 @@ def lambda_handler(event, context):
 
 def verify_project_ownership(user_id, project_id):
     """Verify that the project exists and belongs to the user."""
+    cache_key = (user_id, project_id)
+    is_owner = _OWNERSHIP_CACHE.get(cache_key)
+    if is_owner is not None:
+        return is_owner
+    
     try:
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table(Config.MAIN_TABLE)
-        
         response = table.get_item(
             Key={
                 'PK': f'USER#{user_id}',
@@ -133,7 +184,9 @@ def verify_project_ownership(user_id, project_id):
             }
         )
         
-        return 'Item' in response
+        is_owner = 'Item' in response
+        _OWNERSHIP_CACHE[cache_key] = is_owner
+        return is_owner
     except Exception as e:
         log_error(e, {'function': 'verify_project_ownership', 'user_id': user_id, 'project_id': project_id})
         return False
@@ -152,38 +205,47 @@ def is_valid_status_transition(current_status, new_status):
     return new_status in valid_transitions.get(current_status, [])
 
 
-def update_behavior_training_results(table, project_id, training_id, data):
-    """Update behavior training results when training completes."""
+def get_project_behaviors(table, project_id):
+    """Query the behaviors that belong to a project."""
+    response = table.query(
+        KeyConditionExpression='PK = :pk AND begins_with(SK, :sk_prefix)',
+        ExpressionAttributeValues={
+            ':pk': f'PROJECT#{project_id}',
+            ':sk_prefix': 'BEHAVIOR#'
+        }
+    )
+    
+    return response.get('Items', [])
+
+
+def build_behavior_update(behavior, training_id, data):
+    """Build the update_item arguments that store training results on a behavior."""
+    now = datetime.utcnow().isoformat()
+    training_results = {
+        'accuracy': data.get('accuracy'),
+        'modelPath': data.get('modelPath'),
+        'trainingJobId': training_id,
+        'lastTrainedAt': now
+    }
+    
+    return {
+        'Key': {
+            'PK': behavior['PK'],
+            'SK': behavior['SK']
+        },
+        'UpdateExpression': 'SET trainingResults = :trainingResults, updatedAt = :updatedAt',
+        'ExpressionAttributeValues': {
+            ':trainingResults': training_results,
+            ':updatedAt': now
+        }
+    }
+
+
+def update_behavior_training_results(table, behaviors, project_id, training_id, data):
+    """Update behavior training results one by one when training completes."""
     try:
-        # Query for behaviors in the project
-        response = table.query(
-            KeyConditionExpression='PK = :pk AND begins_with(SK, :sk_prefix)',
-            ExpressionAttributeValues={
-                ':pk': f'PROJECT#{project_id}',
-                ':sk_prefix': 'BEHAVIOR#'
-            }
-        )
-        
-        # Update each behavior with training results
-        for behavior in response.get('Items', []):
-            training_results = {
-                'accuracy': data.get('accuracy'),
-                'modelPath': data.get('modelPath'),
-                'trainingJobId': training_id,
-                'lastTrainedAt': datetime.utcnow().isoformat()
-            }
-            
-            table.update_item(
-                Key={
-                    'PK': behavior['PK'],
-                    'SK': behavior['SK']
-                },
-                UpdateExpression='SET trainingResults = :trainingResults, updatedAt = :updatedAt',
-                ExpressionAttributeValues={
-                    ':trainingResults': training_results,
-                    ':updatedAt': datetime.utcnow().isoformat()
-                }
-            )
+        for behavior in behaviors:
+            table.update_item(**build_behavior_update(behavior, training_id, data))
     except Exception as e:
         log_error(e, {'function': 'update_behavior_training_results', 'project_id': project_id, 'training_id': training_id})
         # Continue even if behavior update fails
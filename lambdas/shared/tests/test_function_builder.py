@@ -0,0 +1,83 @@
+"""Unit tests for the function builder utilities."""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.function_builder import (
+    APP_TEMPLATE_BYTES,
+    REQUIREMENTS_TXT_BYTES,
+    _materialize_venv,
+    create_function_structure,
+    package_function,
+)
+
+
+class TestCreateFunctionStructure:
+    """Test cases for create_function_structure."""
+    
+    def test_writes_scaffold_files(self, tmp_path):
+        """Test that the templates are written in full."""
+        function_path = create_function_structure("get-by-id", "projects", str(tmp_path))
+        
+        assert function_path == os.path.join(str(tmp_path), "projects", "get-by-id")
+        with open(os.path.join(function_path, "app.py"), "rb") as f:
+            assert f.read() == APP_TEMPLATE_BYTES
+        with open(os.path.join(function_path, "requirements.txt"), "rb") as f:
+            assert f.read() == REQUIREMENTS_TXT_BYTES
+    
+    def test_tests_init_names_the_function(self, tmp_path):
+        """Test that tests/__init__.py interpolates the function name."""
+        function_path = create_function_structure("get-by-id", "projects", str(tmp_path))
+        
+        with open(os.path.join(function_path, "tests", "__init__.py")) as f:
+            assert f.read() == "# Tests for get-by-id\n"
+
+
+class TestMaterializeVenv:
+    """Test cases for _materialize_venv."""
+    
+    def test_keeps_symlinks_and_exec_bits(self, tmp_path, monkeypatch):
+        """Test that links survive and copied files stay executable."""
+        shared_dir = tmp_path / "shared"
+        (shared_dir / "lib" / "pkg").mkdir(parents=True)
+        (shared_dir / "lib" / "pkg" / "mod.py").write_text("x = 1\n")
+        (shared_dir / "lib64").symlink_to("lib")
+        script = shared_dir / "bin" / "tool"
+        script.parent.mkdir()
+        script.write_text("#!/bin/sh\n")
+        script.chmod(0o755)
+        (shared_dir / "bin" / "tool-link").symlink_to("tool")
+        
+        # Force the cross-filesystem copy fallback
+        def no_link(src, dst):
+            raise OSError("cross-device link")
+        monkeypatch.setattr(os, "link", no_link)
+        
+        venv_dir = tmp_path / "venv"
+        _materialize_venv(str(shared_dir), str(venv_dir))
+        
+        assert os.readlink(venv_dir / "lib64") == "lib"
+        assert os.readlink(venv_dir / "bin" / "tool-link") == "tool"
+        assert (venv_dir / "lib" / "pkg" / "mod.py").read_text() == "x = 1\n"
+        assert os.access(venv_dir / "bin" / "tool", os.X_OK)
+
+
+class TestPackageFunction:
+    """Test cases for package_function."""
+    
+    def test_manifest_stays_out_of_package(self, tmp_path):
+        """Test that only function files land in the package directory."""
+        function_path = tmp_path / "get-by-id"
+        function_path.mkdir()
+        (function_path / "app.py").write_text("print('hi')\n")
+        output_path = tmp_path / "build" / "get-by-id"
+        
+        assert package_function(str(function_path), str(output_path))
+        assert package_function(str(function_path), str(output_path))
+        
+        assert sorted(os.listdir(output_path)) == ["app.py"]
+        manifest_path = tmp_path / "build" / "get-by-id.manifest.json"
+        assert list(json.loads(manifest_path.read_text())) == ["app.py"]
@@ -5,10 +5,141 @@ This module provides utilities for building and packaging
 Lambda functions with proper dependencies.
 """
 
+import hashlib
+import json
 import os
 import subprocess
 import shutil
-from typing import Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Files copied from a function directory into its deployment package
+PACKAGE_FILES = ("app.py", "requirements.txt", "README.md", "function.yaml")
+
+# Maps packaged file name -> SHA-256, written next to (not inside) each
+# package directory so it never ends up in the deployment zip
+PACKAGE_MANIFEST_SUFFIX = ".manifest.json"
+
+# Download/wheel cache shared by every function's dependency install
+PIP_CACHE_DIR = os.path.expanduser("~/.cache/valthera-pip")
+
+# Stored in .venv to record which requirements.txt it was built from
+REQUIREMENTS_HASH_FILE = ".reqhash"
+
+# One fully installed dependency tree per requirements.txt hash; function
+# .venv directories are hard-linked from here
+VENV_CACHE_DIR = os.path.expanduser("~/.cache/valthera-venvs")
+
+# Serializes progress output from concurrent builds
+_print_lock = threading.Lock()
+
+# Guards shared venv builds where fcntl file locks are unavailable
+_venv_build_lock = threading.Lock()
+
+
+def _log(message: str) -> None:
+    """Print a message without interleaving output from other build threads."""
+    with _print_lock:
+        print(message)
+
+
+def _file_sha256(path: str) -> str:
+    """Return the hex SHA-256 digest of a file, read in 64 KiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _pip_install_command() -> List[str]:
+    """
+    Return the installer command used for function dependencies.
+
+    Prefers uv's pip interface, whose resolver and installer are much
+    faster than pip's, and falls back to pip when uv is not on PATH.
+    Progress bars and colour output are turned off in both cases.
+    """
+    if shutil.which("uv"):
+        return ["uv", "pip", "install", "--quiet", "--no-progress"]
+    return ["pip", "install", "--quiet", "--no-color", "--progress-bar", "off"]
+
+
+def _ensure_shared_venv(function_path: str, requirements_path: str,
+                        requirements_hash: str) -> str:
+    """
+    Return the shared dependency tree for a requirements hash, building it once.
+
+    Concurrent builders (threads or separate processes) wait on a lock
+    file while the first one installs; the install goes to a scratch
+    directory that is renamed into place, so a half-built tree is never
+    picked up.
+    """
+    shared_dir = os.path.join(VENV_CACHE_DIR, requirements_hash)
+    if os.path.isdir(shared_dir):
+        return shared_dir
+
+    os.makedirs(VENV_CACHE_DIR, exist_ok=True)
+    with open(f"{shared_dir}.lock", "w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            _venv_build_lock.acquire()
+        try:
+            if os.path.isdir(shared_dir):
+                return shared_dir
+
+            partial_dir = f"{shared_dir}.partial"
+            shutil.rmtree(partial_dir, ignore_errors=True)
+
+            # Share one download/wheel cache across all function builds
+            os.makedirs(PIP_CACHE_DIR, exist_ok=True)
+            subprocess.run(
+                [
+                    *_pip_install_command(),
+                    "--cache-dir", PIP_CACHE_DIR,
+                    "-r", requirements_path,
+                    "--target", partial_dir,
+                ],
+                cwd=function_path,
+                check=True,
+                env={
+                    **os.environ,
+                    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+                    "PIP_NO_INPUT": "1",
+                },
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+            os.replace(partial_dir, shared_dir)
+            return shared_dir
+        finally:
+            if fcntl is None:
+                _venv_build_lock.release()
+
+
+def _materialize_venv(shared_dir: str, venv_dir: str) -> None:
+    """Recreate venv_dir as hard links into a shared dependency tree."""
+    shutil.rmtree(venv_dir, ignore_errors=True)
+    for root, dirs, files in os.walk(shared_dir):
+        target_root = os.path.join(venv_dir, os.path.relpath(root, shared_dir))
+        os.makedirs(target_root, exist_ok=True)
+        # os.walk lists linked directories (e.g. lib64 -> lib) without
+        # descending into them, so recreate those links alongside the files
+        linked_dirs = [name for name in dirs if os.path.islink(os.path.join(root, name))]
+        for name in linked_dirs + files:
+            src = os.path.join(root, name)
+            dst = os.path.join(target_root, name)
+            if os.path.islink(src):
+                os.symlink(os.readlink(src), dst)
+            else:
+                _link_or_copy(src, dst)
 
 
 def build_function_dependencies(function_path: str) -> bool:
@@ -16,8 +147,8 @@ def build_function_dependencies(function_path: str) -> bool:
     Ensure function dependencies via requirements.txt for AWS SAM.
 
     If a requirements.txt is missing, scaffold a minimal one.
-    Then install packages into a local .venv folder for local testing,
-    while SAM will vendor deps during `sam build`.
+    Then install packages into a local .venv folder for local testing
+    (using uv when available), while SAM will vendor deps during `sam build`.
 
     Args:
         function_path: Path to the function directory
@@ -28,36 +159,74 @@ def build_function_dependencies(function_path: str) -> bool:
     try:
         requirements_path = os.path.join(function_path, "requirements.txt")
         if not os.path.exists(requirements_path):
-            print(f"requirements.txt not found in {function_path}; creating a minimal one")
-            with open(requirements_path, "w") as f:
-                f.write("boto3==1.40.4\n")
-                f.write("botocore==1.40.4\n")
-                f.write("jmespath==1.0.1\n")
-                f.write("python-dateutil==2.9.0.post0\n")
-                f.write("s3transfer==0.13.1\n")
-                f.write("six==1.17.0\n")
-                f.write("urllib3>=1.21.1,<3\n")
+            _log(f"requirements.txt not found in {function_path}; creating a minimal one")
+            _write_bytes(requirements_path, REQUIREMENTS_TXT_BYTES)
 
         venv_dir = os.path.join(function_path, ".venv")
         os.makedirs(venv_dir, exist_ok=True)
 
-        subprocess.run(
-            ["pip", "install", "-r", requirements_path, "-t", venv_dir],
-            cwd=function_path,
-            check=True,
-        )
+        # Skip the install entirely when requirements.txt has not changed
+        requirements_hash = _file_sha256(requirements_path)
+        hash_path = os.path.join(venv_dir, REQUIREMENTS_HASH_FILE)
+        if os.path.exists(hash_path):
+            with open(hash_path) as f:
+                if f.read() == requirements_hash:
+                    _log(f"Dependencies up to date for {function_path}")
+                    return True
+
+        # Functions with identical requirements share one installed tree;
+        # each .venv only holds hard links into it
+        shared_dir = _ensure_shared_venv(function_path, requirements_path, requirements_hash)
+        _materialize_venv(shared_dir, venv_dir)
 
-        print(f"Dependencies prepared for {function_path}")
+        with open(hash_path, "w") as f:
+            f.write(requirements_hash)
+
+        _log(f"Dependencies prepared for {function_path}")
         return True
 
     except subprocess.CalledProcessError as e:
-        print(f"Error installing dependencies for {function_path}: {e}")
+        _log(f"Error installing dependencies for {function_path}: {e}")
+        if e.stderr:
+            _log(e.stderr.decode(errors="replace"))
         return False
     except Exception as e:
-        print(f"Unexpected error preparing dependencies for {function_path}: {e}")
+        _log(f"Unexpected error preparing dependencies for {function_path}: {e}")
         return False
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    """
+    Place src at dst without copying bytes when possible.
+
+    Hard links share the source inode on the same filesystem; across
+    filesystems fall back to copy2, which keeps the permission bits (so
+    console scripts stay executable) and the timestamps _needs_copy checks.
+    """
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _copy_timestamps(src: str, dst: str) -> None:
+    """Give dst the timestamps of src so _needs_copy can recognise the copy."""
+    src_stat = os.stat(src)
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+def _needs_copy(src: str, dst: str) -> bool:
+    """Return False when dst already matches src by modification time and size."""
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return True
+    return (src_stat.st_mtime_ns, src_stat.st_size) != (dst_stat.st_mtime_ns, dst_stat.st_size)
+
+
 def package_function(function_path: str, output_path: str) -> bool:
     """
     Package a function for deployment.
@@ -73,21 +242,42 @@ def package_function(function_path: str, output_path: str) -> bool:
         # Create output directory
         os.makedirs(output_path, exist_ok=True)
         
-        # Copy function code
-        app_file = os.path.join(function_path, "app.py")
-        if os.path.exists(app_file):
-            shutil.copy2(app_file, output_path)
-        
-        # Copy requirements.txt if it exists
-        requirements_file = os.path.join(function_path, "requirements.txt")
-        if os.path.exists(requirements_file):
-            shutil.copy2(requirements_file, output_path)
+        # Hashes of the files placed by the previous packaging run
+        manifest_path = os.path.normpath(output_path) + PACKAGE_MANIFEST_SUFFIX
+        manifest = {}
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
         
-        # Copy any other necessary files
-        for file_name in ["README.md", "function.yaml"]:
+        # Copy function code, requirements and any other necessary files,
+        # skipping those whose content matches the manifest
+        new_manifest = {}
+        for file_name in PACKAGE_FILES:
             file_path = os.path.join(function_path, file_name)
-            if os.path.exists(file_path):
-                shutil.copy2(file_path, output_path)
+            if not os.path.exists(file_path):
+                continue
+            
+            # Unchanged mtime and size: reuse the recorded hash without reading
+            dst = os.path.join(output_path, file_name)
+            if file_name in manifest and not _needs_copy(file_path, dst):
+                new_manifest[file_name] = manifest[file_name]
+                continue
+            
+            file_hash = _file_sha256(file_path)
+            new_manifest[file_name] = file_hash
+            if (manifest.get(file_name) == file_hash and os.path.exists(dst)
+                    and _file_sha256(dst) == file_hash):
+                # Touched but unchanged: sync the timestamps so later runs
+                # skip hashing again
+                _copy_timestamps(file_path, dst)
+            else:
+                _link_or_copy(file_path, dst)
+        
+        # Replace the manifest atomically so an interrupted run can't corrupt it
+        tmp_manifest_path = manifest_path + ".tmp"
+        with open(tmp_manifest_path, "w") as f:
+            json.dump(new_manifest, f, indent=2)
+        os.replace(tmp_manifest_path, manifest_path)
         
         print(f"Successfully packaged {function_path} to {output_path}")
         return True
@@ -107,46 +297,49 @@ def build_all_functions(functions_dir: str) -> Dict[str, bool]:
     Returns:
         Dictionary mapping function paths to build success status
     """
-    results = {}
+    function_paths = []
     
-    for domain_dir in os.listdir(functions_dir):
-        domain_path = os.path.join(functions_dir, domain_dir)
-        if not os.path.isdir(domain_path):
-            continue
-            
-        for function_dir in os.listdir(domain_path):
-            function_path = os.path.join(domain_path, function_dir)
-            if not os.path.isdir(function_path):
+    # scandir entries carry the file type, avoiding a stat() per name
+    with os.scandir(functions_dir) as domain_entries:
+        for domain_entry in domain_entries:
+            if not domain_entry.is_dir():
                 continue
                 
-            print(f"Building function: {function_path}")
-            success = build_function_dependencies(function_path)
-            results[function_path] = success
+            with os.scandir(domain_entry.path) as function_entries:
+                for function_entry in function_entries:
+                    if not function_entry.is_dir():
+                        continue
+                        
+                    _log(f"Building function: {function_entry.path}")
+                    function_paths.append(function_entry.path)
+    
+    # Installs are dominated by subprocess/network I/O, so threads run
+    # them in parallel without the overhead of extra interpreters
+    results = {}
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(build_function_dependencies, function_path): function_path
+            for function_path in function_paths
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
             
     return results
 
 
-def create_function_structure(
-    function_name: str,
-    domain: str,
-    base_path: str = "functions"
-) -> str:
-    """
-    Create a new function directory structure.
-    
-    Args:
-        function_name: Name of the function
-        domain: Domain name (e.g., 'account', 'concepts')
-        base_path: Base path for functions
-        
-    Returns:
-        Path to the created function directory
-    """
-    function_path = os.path.join(base_path, domain, function_name)
-    os.makedirs(function_path, exist_ok=True)
-    
-    # Create app.py template
-    app_template = '''import json
+# Minimal SAM-friendly requirements for a new function
+REQUIREMENTS_TXT = """boto3==1.40.4
+botocore==1.40.4
+jmespath==1.0.1
+python-dateutil==2.9.0.post0
+s3transfer==0.13.1
+six==1.17.0
+urllib3>=1.21.1,<3
+"""
+
+# app.py scaffold written by create_function_structure
+APP_TEMPLATE = '''import json
 from valthera_core import auth, responses, monitoring
 
 def lambda_handler(event, context):
@@ -160,17 +353,11 @@ def lambda_handler(event, context):
         
         # Route to appropriate handler based on HTTP method
         method = event.get('httpMethod', 'GET')
-        
-        if method == 'GET':
-            return handle_get(event, context, user)
-        elif method == 'POST':
-            return handle_post(event, context, user)
-        elif method == 'PUT':
-            return handle_put(event, context, user)
-        elif method == 'DELETE':
-            return handle_delete(event, context, user)
-        else:
+        handler = HANDLERS.get(method)
+        if handler is None:
             return responses.method_not_allowed()
+        
+        return handler(event, context, user)
             
     except Exception as e:
         monitoring.log_error(e)
@@ -195,23 +382,49 @@ def handle_delete(event, context, user):
     """Handle DELETE requests."""
     # Implementation specific to function
     return responses.success_response({"message": "DELETE not implemented"})
+
+# HTTP method dispatch table, built once at cold start
+HANDLERS = {
+    'GET': handle_get,
+    'POST': handle_post,
+    'PUT': handle_put,
+    'DELETE': handle_delete,
+}
 '''
+
+# Pre-encoded once so scaffolding skips the text-mode encode per file
+REQUIREMENTS_TXT_BYTES = REQUIREMENTS_TXT.encode()
+APP_TEMPLATE_BYTES = APP_TEMPLATE.encode()
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write pre-encoded data to path in binary mode."""
+    # The buffered writer retries short writes until every byte is written
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def create_function_structure(
+    function_name: str,
+    domain: str,
+    base_path: str = "functions"
+) -> str:
+    """
+    Create a new function directory structure.
     
-    with open(os.path.join(function_path, "app.py"), "w") as f:
-        f.write(app_template)
+    Args:
+        function_name: Name of the function
+        domain: Domain name (e.g., 'account', 'concepts')
+        base_path: Base path for functions
+        
+    Returns:
+        Path to the created function directory
+    """
+    function_path = os.path.join(base_path, domain, function_name)
+    os.makedirs(function_path, exist_ok=True)
     
-    # Create requirements.txt template (SAM-friendly)
-    requirements_txt = """boto3==1.40.4
-botocore==1.40.4
-jmespath==1.0.1
-python-dateutil==2.9.0.post0
-s3transfer==0.13.1
-six==1.17.0
-urllib3>=1.21.1,<3
-"""
-
-    with open(os.path.join(function_path, "requirements.txt"), "w") as f:
-        f.write(requirements_txt)
+    _write_bytes(os.path.join(function_path, "app.py"), APP_TEMPLATE_BYTES)
+    _write_bytes(os.path.join(function_path, "requirements.txt"), REQUIREMENTS_TXT_BYTES)
     
     # Create README.md template
     readme_template = f'''# {function_name}
@@ -231,14 +444,15 @@ pytest
 This function is deployed as part of the SAM template.
 '''
     
-    with open(os.path.join(function_path, "README.md"), "w") as f:
-        f.write(readme_template)
+    _write_bytes(os.path.join(function_path, "README.md"), readme_template.encode())
     
     # Create tests directory
     tests_path = os.path.join(function_path, "tests")
     os.makedirs(tests_path, exist_ok=True)
     
-    with open(os.path.join(tests_path, "__init__.py"), "w") as f:
-        f.write("# Tests for {function_name}\n")
+    _write_bytes(
+        os.path.join(tests_path, "__init__.py"),
+        f"# Tests for {function_name}\n".encode(),
+    )
     
-    return function_path 
\ No newline at end of file
+    return function_path
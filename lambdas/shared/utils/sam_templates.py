@@ -7,8 +7,37 @@ and managing function configurations.
 
 import yaml
 import os
+import tempfile
 from typing import Dict, List, Any
 
+# Prefer the libyaml-backed C emitter/parser; fall back to pure Python
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
+
+class _TemplateDumper(_Dumper):
+    """YAML dumper that never emits anchors/aliases."""
+
+    def ignore_aliases(self, data):
+        # Callers may pass the same object (e.g. a policy list) to several
+        # functions; CloudFormation does not accept YAML anchors/aliases, so
+        # always emit full copies
+        return True
+
+
+# Resource type of every generated function
+_FUNCTION_TYPE = "AWS::Serverless::Function"
+
+# Tags shared by every generated function; copied per call so each
+# template owns its own mutable dict
+_FUNCTION_TAGS = {
+    "Project": "valthera",
+    "Environment": "${Environment}",
+    "ManagedBy": "SAM"
+}
+
 
 def generate_function_template(
     function_name: str,
@@ -40,36 +69,31 @@ def generate_function_template(
     Returns:
         SAM function template dictionary
     """
-    template = {
-        "Type": "AWS::Serverless::Function",
-        "Properties": {
-            "FunctionName": f"${{ResourcePrefix}}-{function_name}",
-            "CodeUri": code_uri,
-            "Handler": handler,
-            "Runtime": runtime,
-            "Timeout": timeout,
-            "MemorySize": memory_size,
-            "Environment": {
-                "Variables": environment_variables or {}
-            },
-            "Tags": {
-                "Project": "valthera",
-                "Environment": "${Environment}",
-                "ManagedBy": "SAM"
-            }
-        }
+    # Nested mappings are fresh dicts per call so templates stay mutable and
+    # JSON serializable
+    properties = {
+        "FunctionName": f"${{ResourcePrefix}}-{function_name}",
+        "CodeUri": code_uri,
+        "Handler": handler,
+        "Runtime": runtime,
+        "Timeout": timeout,
+        "MemorySize": memory_size,
+        "Environment": {
+            "Variables": dict(environment_variables or {})
+        },
+        "Tags": dict(_FUNCTION_TAGS)
     }
     
     if policies:
-        template["Properties"]["Policies"] = policies
+        properties["Policies"] = policies
         
     if events:
-        template["Properties"]["Events"] = events
+        properties["Events"] = events
         
     if layers:
-        template["Properties"]["Layers"] = layers
+        properties["Layers"] = layers
         
-    return template
+    return {"Type": _FUNCTION_TYPE, "Properties": properties}
 
 
 def generate_domain_template(
@@ -94,9 +118,10 @@ def generate_domain_template(
     }
     
     for function_config in functions:
-        function_name = function_config["name"]
+        function_config = dict(function_config)
+        function_name = function_config.pop("name")
         template["Resources"][f"{function_name}Function"] = (
-            generate_function_template(**function_config)
+            generate_function_template(function_name=function_name, **function_config)
         )
         
     return template
@@ -110,10 +135,28 @@ def save_template(template: Dict[str, Any], file_path: str):
         template: SAM template dictionary
         file_path: Path to save the template
     """
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    
-    with open(file_path, 'w') as f:
-        yaml.dump(template, f, default_flow_style=False, sort_keys=False)
+    directory = os.path.dirname(file_path)
+    os.makedirs(directory, exist_ok=True)
+
+    data = yaml.dump(
+        template,
+        Dumper=_TemplateDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        encoding="utf-8"
+    )
+
+    # Write next to the target and rename over it, so readers never see a
+    # partially written template
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def load_template(file_path: str) -> Dict[str, Any]:
@@ -126,5 +169,7 @@ def load_template(file_path: str) -> Dict[str, Any]:
     Returns:
         SAM template dictionary
     """
-    with open(file_path, 'r') as f:
-        return yaml.safe_load(f) 
\ No newline at end of file
+    # Hand the parser one contiguous buffer instead of a file it reads piecemeal
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    return yaml.load(data, Loader=_Loader) 
\ No newline at end of file
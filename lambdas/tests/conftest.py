@@ -0,0 +1,63 @@
+"""Shared fixtures for the Lambda handler tests.
+
+Handlers import boto3, cachetools and the valthera_core layer at module load,
+none of which are available outside the Lambda runtime, so the fixture below
+installs lightweight stand-ins before loading a handler's ``app.py``.
+"""
+import importlib.util
+import os
+import sys
+import types
+from unittest import mock
+
+import pytest
+
+FUNCTIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'functions')
+
+
+def _response(status_code, body):
+    return {'statusCode': status_code, 'body': body}
+
+
+def _valthera_core_stub():
+    module = types.ModuleType('valthera_core')
+    module.Config = types.SimpleNamespace(MAIN_TABLE='valthera-test')
+    module.log_execution_time = lambda fn: fn
+    module.log_request_info = lambda event: None
+    module.log_response_info = lambda response: None
+    module.log_error = mock.MagicMock()
+    module.get_user_id_from_event = lambda event: 'user-1'
+    module.get_dynamodb_resource = mock.MagicMock()
+    module.get_s3_client = mock.MagicMock()
+    module.success_response = lambda data, status_code=200: _response(status_code, data)
+    module.error_response = lambda message, status_code=400, code=None: _response(status_code, {'error': message})
+    module.not_found_response = lambda resource, resource_id: _response(404, {'error': resource})
+    return module
+
+
+class _TTLCache(dict):
+    def __init__(self, maxsize, ttl):
+        super().__init__()
+
+
+@pytest.fixture
+def load_function_app(monkeypatch):
+    """Return a loader for ``functions/<relative_dir>/app.py`` with stubbed dependencies."""
+    boto3 = types.ModuleType('boto3')
+    boto3.resource = mock.MagicMock()
+    boto3.client = mock.MagicMock()
+    cachetools = types.ModuleType('cachetools')
+    cachetools.TTLCache = _TTLCache
+    monkeypatch.setitem(sys.modules, 'boto3', boto3)
+    monkeypatch.setitem(sys.modules, 'cachetools', cachetools)
+    monkeypatch.setitem(sys.modules, 'valthera_core', _valthera_core_stub())
+
+    def load(relative_dir):
+        path = os.path.join(FUNCTIONS_DIR, relative_dir, 'app.py')
+        name = 'app_' + relative_dir.replace('/', '_').replace('-', '_')
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
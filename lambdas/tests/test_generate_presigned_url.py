@@ -0,0 +1,45 @@
+"""Unit tests for the generate-presigned-url function."""
+
+import pytest
+
+
+@pytest.fixture
+def validate_file_type(load_function_app):
+    return load_function_app('datasources/generate-presigned-url').validate_file_type
+
+
+class TestValidateFileType:
+    """Test cases for validate_file_type."""
+    
+    @pytest.mark.parametrize("filename", [
+        "video.mp4",
+        "VIDEO.MP4",
+        "clip.final.mov",
+        "uploads/2024/video.webm",
+        "dir.v2/video.mkv",
+    ])
+    def test_accepts_allowed_extensions(self, validate_file_type, filename):
+        """Test that supported video extensions are accepted."""
+        assert validate_file_type(filename) == (True, None)
+    
+    @pytest.mark.parametrize("filename", [
+        "video",
+        ".mp4",
+        "dir/.mp4",
+        "dir.v2/video",
+    ])
+    def test_rejects_missing_extension(self, validate_file_type, filename):
+        """Test that dotfiles and dotted directory names have no extension."""
+        assert validate_file_type(filename) == (False, 'File must have a valid extension')
+    
+    @pytest.mark.parametrize("filename, extension", [
+        ("image.png", ".png"),
+        ("archive.tar.GZ", ".gz"),
+        ("video.", "."),
+    ])
+    def test_rejects_unsupported_extensions(self, validate_file_type, filename, extension):
+        """Test that other extensions are rejected and named in the error."""
+        is_valid, error = validate_file_type(filename)
+        
+        assert is_valid is False
+        assert error.startswith(f'File type {extension} is not supported')
@@ -0,0 +1,71 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+
+@pytest.fixture
+def app(load_function_app):
+    module = load_function_app('training/update-status')
+    module.table.get_item.return_value = {
+        'Item': {'PK': 'PROJECT#p1', 'SK': 'TRAINING#t1', 'status': 'validating'}
+    }
+    module.table.query.return_value = {
+        'Items': [{'PK': 'PROJECT#p1', 'SK': 'BEHAVIOR#b1'}]
+    }
+    module.table.update_item.return_value = {
+        'Attributes': {'PK': 'PROJECT#p1', 'SK': 'TRAINING#t1', 'status': 'completed'}
+    }
+    return module
+
+
+def completed_event(accuracy=0.93):
+    return {
+        'pathParameters': {'projectId': 'p1', 'id': 't1'},
+        'body': json.dumps({'status': 'completed', 'progress': 1.0, 'accuracy': accuracy}),
+    }
+
+
+class TestUpdateTrainingStatus:
+    """Test cases for completing a training job."""
+
+    def test_float_accuracy_is_written_as_decimal(self, app):
+        """Test that float values reach DynamoDB as Decimal."""
+        response = app.lambda_handler(completed_event(), None)
+
+        assert response['statusCode'] == 200
+        transact = app.dynamodb.meta.client.transact_write_items
+        items = transact.call_args.kwargs['TransactItems']
+        job_values = items[0]['Update']['ExpressionAttributeValues']
+        behavior_update = items[1]['Update']
+        results = behavior_update['ExpressionAttributeValues'][':trainingResults']
+        assert job_values[':progress'] == Decimal('1.0')
+        assert results['accuracy'] == Decimal('0.93')
+        assert behavior_update['TableName'] == 'valthera-test'
+        app.table.update_item.assert_not_called()
+
+    def test_failed_transaction_still_updates_job(self, app):
+        """Test that a failed behavior write does not fail the status update."""
+        app.dynamodb.meta.client.transact_write_items.side_effect = RuntimeError('boom')
+
+        response = app.lambda_handler(completed_event(), None)
+
+        assert response['statusCode'] == 200
+        job_update, behavior_update = app.table.update_item.call_args_list
+        assert job_update.kwargs['Key'] == {'PK': 'PROJECT#p1', 'SK': 'TRAINING#t1'}
+        assert behavior_update.kwargs['Key'] == {'PK': 'PROJECT#p1', 'SK': 'BEHAVIOR#b1'}
+        assert 'TableName' not in behavior_update.kwargs
+        assert behavior_update.kwargs['ExpressionAttributeValues'][':trainingResults']['accuracy'] == Decimal('0.93')
+
+    def test_behavior_failure_is_not_fatal(self, app):
+        """Test that behavior write errors after the job update are swallowed."""
+        app.dynamodb.meta.client.transact_write_items.side_effect = RuntimeError('boom')
+        app.table.update_item.side_effect = [
+            {'Attributes': {'PK': 'PROJECT#p1', 'SK': 'TRAINING#t1', 'status': 'completed'}},
+            RuntimeError('behavior write failed'),
+        ]
+
+        response = app.lambda_handler(completed_event(), None)
+
+        assert response['statusCode'] == 200
+        assert response['body']['status'] == 'completed'
@@ -12,6 +12,7 @@ import argparse
 import logging
 import numpy as np
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -33,6 +34,17 @@ def as_gif(images, path="temp.gif"):
     return gif_bytes
 
 
+def save_frames(images, frames_dir: Path):
+    """Save frames as numbered PNGs, encoding them in parallel."""
+    # PNG encoding releases the GIL, so a thread pool encodes frames concurrently
+    def save(item):
+        i, img = item
+        img.save(frames_dir / f"frame_{i:04d}.png")
+    
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(save, enumerate(images)))
+
+
 class DROIDGIFExtractor:
     """Extract DROID robot videos from old TFDS format with comprehensive parsing."""
     
@@ -130,9 +142,7 @@ class DROIDGIFExtractor:
                     frames_dir = sample_dir / "frames"
                     frames_dir.mkdir(exist_ok=True)
                     
-                    for i, img in enumerate(images):
-                        frame_path = frames_dir / f"frame_{i:04d}.png"
-                        img.save(frame_path)
+                    save_frames(images, frames_dir)
                     
                     # Create metadata
                     metadata = {
@@ -4,19 +4,28 @@ A domain-agnostic library for learning from expert demonstrations across
 multiple domains including robotics, finance, gaming, and autonomous driving.
 """
 
-from .core.bc import BC
-from .core.registry import Registry
-from .core.base import BaseObservationProcessor, BaseActionProcessor, BasePolicy
-
-# Import new components for behavioral cloning
-try:
-    from .models.components.vision_encoder import VisionEncoder
-    from .models.components.policy_network import PolicyNetwork, GRUPolicy, LSTMPolicy
-    from .models.components.behavioral_cloning import BehavioralCloningModel
-    from .training.behavioral_cloning import BehavioralCloningTrainer
-except ImportError:
-    # Components might not be available in all installations
-    pass
+import importlib
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package doesn't pull in torch and the model components up front.
+_CORE_EXPORTS = {
+    "BC": ".core.bc",
+    "Registry": ".core.registry",
+    "BaseObservationProcessor": ".core.base",
+    "BaseActionProcessor": ".core.base",
+    "BasePolicy": ".core.base",
+}
+
+# New components for behavioral cloning; these might not be available in all
+# installations, in which case the name is simply missing from the package.
+_OPTIONAL_EXPORTS = {
+    "VisionEncoder": ".models.components.vision_encoder",
+    "PolicyNetwork": ".models.components.policy_network",
+    "GRUPolicy": ".models.components.policy_network",
+    "LSTMPolicy": ".models.components.policy_network",
+    "BehavioralCloningModel": ".models.components.behavioral_cloning",
+    "BehavioralCloningTrainer": ".training.behavioral_cloning",
+}
 
 __version__ = "0.1.0"
 __all__ = [
@@ -33,3 +42,23 @@ __all__ = [
     "BehavioralCloningModel",
     "BehavioralCloningTrainer"
 ]
+
+
+def __getattr__(name):
+    if name in _CORE_EXPORTS:
+        module = importlib.import_module(_CORE_EXPORTS[name], __name__)
+    elif name in _OPTIONAL_EXPORTS:
+        try:
+            module = importlib.import_module(_OPTIONAL_EXPORTS[name], __name__)
+        except ImportError as e:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from e
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,7 @@
 """Main Behavioral Cloning (BC) class for Valthera."""
 
+import copy
+import functools
 import logging
 from typing import Any, Dict, List, Optional, Union
 import numpy as np
@@ -20,6 +22,13 @@ from .registry import registry
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML config file, cached per path and modification time."""
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+
 class BC:
     """Main Behavioral Cloning class that orchestrates the entire pipeline.
     
@@ -67,8 +76,10 @@ class BC:
     def _load_domain_config(self) -> Dict[str, Any]:
         """Load domain-specific configuration."""
         if self.config_path and os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            config_path = os.path.abspath(self.config_path)
+            config = _load_yaml_config(config_path, os.stat(config_path).st_mtime_ns)
+            # The parsed config is shared between pipelines; hand out a copy
+            return copy.deepcopy(config)
         
         # Return default config for the domain
         return self._get_default_domain_config()
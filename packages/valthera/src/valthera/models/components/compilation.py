@@ -0,0 +1,51 @@
+"""torch.compile helpers shared by the model components."""
+
+import functools
+import logging
+from typing import Callable
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+
+def compile_with_fallback(fn: Callable, **compile_kwargs) -> Callable:
+    """Wrap fn with torch.compile, running it eagerly if compilation fails.
+
+    torch.compile is lazy: dynamo/inductor errors (e.g. no C++ toolchain for
+    inductor on CPU, no MPS backend) only surface on the first call, not when
+    compile() returns. The first call is therefore guarded; if it raises, the
+    compiled version is dropped and fn runs eagerly from then on. Later calls
+    go straight to the compiled function. On PyTorch builds without
+    torch.compile, fn is returned unchanged.
+
+    Args:
+        fn: Function or bound method to compile
+        **compile_kwargs: Keyword arguments passed to torch.compile
+
+    Returns:
+        Callable with the same signature as fn
+    """
+    if not hasattr(torch, "compile"):
+        return fn
+
+    compiled = torch.compile(fn, **compile_kwargs)
+    first_call = True
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        nonlocal compiled, first_call
+        if compiled is None:
+            return fn(*args, **kwargs)
+        if not first_call:
+            return compiled(*args, **kwargs)
+
+        first_call = False
+        try:
+            return compiled(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"torch.compile failed, running eagerly: {e}")
+            compiled = None
+            return fn(*args, **kwargs)
+
+    return run
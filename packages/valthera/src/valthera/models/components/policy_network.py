@@ -7,6 +7,7 @@ from typing import Optional, Tuple, Dict, Any
 import numpy as np
 
 from ...core.base import BaseComponent
+from .compilation import compile_with_fallback
 
 
 class PolicyNetwork(BaseComponent, nn.Module):
@@ -23,9 +24,17 @@ class PolicyNetwork(BaseComponent, nn.Module):
         self.output_dim = config.get("output_dim", 6)  # [dx, dy, dz, dyaw, grip, stop]
         self.dropout = config.get("dropout", 0.1)
         self.use_lstm = config.get("use_lstm", False)
+        self.compile_network = config.get("compile", False)
         
         # Initialize network
         self.network = self._create_network()
+        
+        # Optionally compile the forward computation (PyTorch 2+); inductor fuses
+        # the projection epilogues and drops per-layer Python dispatch
+        self._run_network = self._forward_network
+        if self.compile_network:
+            self._run_network = compile_with_fallback(self._forward_network)
+        
         self._is_initialized = True
     
     def _create_network(self) -> nn.Module:
@@ -73,6 +82,10 @@ class PolicyNetwork(BaseComponent, nn.Module):
         if not self._is_initialized:
             raise RuntimeError("Policy network not initialized")
         
+        return self._run_network(x, hidden_state)
+    
+    def _forward_network(self, x: torch.Tensor, hidden_state: Optional[torch.Tensor] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Run the projection, recurrent and output layers."""
         # Input projection
         x = F.relu(self.network['input_proj'](x))
         
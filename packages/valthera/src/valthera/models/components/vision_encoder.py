@@ -5,9 +5,9 @@ import torch.nn as nn
 import torch.nn.functional as F
 import numpy as np
 from typing import Optional, Tuple, Union
-import cv2
 
 from ...core.base import BaseComponent
+from .compilation import compile_with_fallback
 
 
 class VisionEncoder(BaseComponent, nn.Module):
@@ -22,10 +22,17 @@ class VisionEncoder(BaseComponent, nn.Module):
         self.image_size = config.get("image_size", (224, 224))
         self.use_pretrained = config.get("use_pretrained", False)
         self.freeze_encoder = config.get("freeze_encoder", True)
+        self.compile_network = config.get("compile", False)
         
         # Initialize encoder
         self.encoder = self._create_encoder()
         
+        # Optionally compile the forward computation (PyTorch 2+); inductor fuses
+        # the Linear+ReLU pairs in the head into single addmm epilogues
+        self._run_encoder = self._forward_encoder
+        if self.compile_network:
+            self._run_encoder = compile_with_fallback(self._forward_encoder)
+        
         # Freeze if requested
         if self.freeze_encoder:
             for param in self.encoder.parameters():
@@ -70,6 +77,10 @@ class VisionEncoder(BaseComponent, nn.Module):
             nn.Linear(1024, self.output_dim)  # Use dynamic output_dim
         )
         
+        # Keep conv weights in channels_last (NHWC) so convolutions run on the
+        # NHWC kernels without per-layer layout conversions
+        encoder = encoder.to(memory_format=torch.channels_last)
+        
         return nn.ModuleDict({
             'features': encoder,
             'classifier': classifier
@@ -78,6 +89,10 @@ class VisionEncoder(BaseComponent, nn.Module):
     def preprocess_image(self, image: Union[np.ndarray, torch.Tensor]) -> torch.Tensor:
         """Preprocess image for the encoder."""
         if isinstance(image, np.ndarray):
+            # OpenCV is only needed for raw array input; import it here so
+            # that importing the package doesn't pay its load time.
+            import cv2
+
             # Resize and convert to RGB
             if len(image.shape) == 3 and image.shape[2] == 3:
                 # BGR to RGB conversion
@@ -145,6 +160,13 @@ class VisionEncoder(BaseComponent, nn.Module):
     
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """Forward pass through the encoder."""
+        # Convert the input batch to the conv stack's memory layout once
+        if x.dim() == 4:
+            x = x.contiguous(memory_format=torch.channels_last)
+        return self._run_encoder(x)
+    
+    def _forward_encoder(self, x: torch.Tensor) -> torch.Tensor:
+        """Run the conv features and the classifier head."""
         features = self.encoder['features'](x)
         embeddings = self.encoder['classifier'](features)
         return embeddings
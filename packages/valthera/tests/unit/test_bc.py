@@ -2,6 +2,7 @@
 
 import pytest
 import numpy as np
+import yaml
 from unittest.mock import Mock, patch, MagicMock
 
 # Make torch optional for testing
@@ -63,6 +64,20 @@ class TestBC:
         assert config["dataset"] == "default"
         assert config["model"] == "mlp"
     
+    def test_load_domain_config_from_file_is_cached(self, tmp_path):
+        """Test that a config file is parsed once and each pipeline gets its own copy."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("dataset: droid\ntraining:\n  epochs: 5\n")
+        
+        with patch('valthera.core.bc.yaml.safe_load', wraps=yaml.safe_load) as mock_load:
+            first = BC(domain="robotics", config_path=str(config_file))
+            second = BC(domain="robotics", config_path=str(config_file))
+        
+        assert mock_load.call_count == 1
+        assert first.config == {"dataset": "droid", "training": {"epochs": 5}}
+        first.config["training"]["epochs"] = 10
+        assert second.config["training"]["epochs"] == 5
+    
     @patch('valthera.core.bc.registry')
     def test_initialize_components_success(self, mock_registry):
         """Test successful component initialization."""
@@ -22,6 +22,10 @@ BEHAVIOR_CLASSES = {
 IMAGENET_DEFAULT_MEAN = (0.485, 0.456, 0.406)
 IMAGENET_DEFAULT_STD = (0.229, 0.224, 0.225)
 
+# Normalization stats shaped once for broadcasting over T x C x H x W clips
+_IMAGENET_MEAN = torch.tensor(IMAGENET_DEFAULT_MEAN, dtype=torch.float32).view(1, 3, 1, 1)
+_IMAGENET_STD = torch.tensor(IMAGENET_DEFAULT_STD, dtype=torch.float32).view(1, 3, 1, 1)
+
 class CustomBehaviorDataset(Dataset):
     def __init__(self, data_dir, transform=None):
         self.data_dir = data_dir
@@ -79,9 +83,7 @@ def simple_video_transform(video, img_size=384):
         video = F.interpolate(video, size=(img_size, img_size), mode='bilinear', align_corners=False)
     
     # Normalize with ImageNet stats
-    mean = torch.tensor(IMAGENET_DEFAULT_MEAN, dtype=torch.float32).view(1, 3, 1, 1)
-    std = torch.tensor(IMAGENET_DEFAULT_STD, dtype=torch.float32).view(1, 3, 1, 1)
-    video = (video - mean) / std
+    video = (video - _IMAGENET_MEAN) / _IMAGENET_STD
     
     # Reshape to match expected input format: [C, T, H, W] (no batch dimension)
     video = video.permute(1, 0, 2, 3)  # C x T x H x W
@@ -134,9 +136,18 @@ def train_custom_classifier():
     val_size = len(dataset) - train_size
     train_dataset, val_dataset = torch.utils.data.random_split(dataset, [train_size, val_size])
     
-    # Create data loaders
-    train_loader = DataLoader(train_dataset, batch_size=2, shuffle=True, num_workers=0)
-    val_loader = DataLoader(val_dataset, batch_size=2, shuffle=False, num_workers=0)
+    # Create data loaders. Worker processes decode the next videos while the
+    # encoder runs on the current batch; pinned host batches let the copies
+    # below run asynchronously
+    loader_kwargs = dict(
+        batch_size=2,
+        num_workers=2,
+        prefetch_factor=2,
+        persistent_workers=True,
+        pin_memory=device.type == "cuda",
+    )
+    train_loader = DataLoader(train_dataset, shuffle=True, **loader_kwargs)
+    val_loader = DataLoader(val_dataset, shuffle=False, **loader_kwargs)
     
     print(f"Train samples: {len(train_dataset)}, Val samples: {len(val_dataset)}")
     
@@ -161,10 +172,10 @@ def train_custom_classifier():
         train_total = 0
         
         for batch_idx, (videos, labels) in enumerate(train_loader):
-            videos = videos.to(device)
-            labels = labels.to(device)
+            videos = videos.to(device, non_blocking=True)
+            labels = labels.to(device, non_blocking=True)
             
-            optimizer.zero_grad()
+            optimizer.zero_grad(set_to_none=True)
             
             # Forward pass through frozen encoder
             with torch.no_grad():
@@ -195,8 +206,8 @@ def train_custom_classifier():
         
         with torch.no_grad():
             for videos, labels in val_loader:
-                videos = videos.to(device)
-                labels = labels.to(device)
+                videos = videos.to(device, non_blocking=True)
+                labels = labels.to(device, non_blocking=True)
                 
                 features = encoder(videos)
                 logits = classifier(features)